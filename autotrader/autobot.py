@@ -1,12 +1,50 @@
 import os
 import importlib
 import traceback
+import numpy as np
 import pandas as pd
+from collections import namedtuple
 from datetime import datetime, timezone
-from autotrader.autodata import AutoData
 from autotrader.brokers.trading import Order
 from concurrent.futures import ThreadPoolExecutor
-from autotrader.utilities import get_data_config, TradeAnalysis
+
+# Order types which require a direction to be specified
+_DIRECTIONAL_ORDER_TYPES = frozenset({"market", "limit", "stop-limit", "reduce"})
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Cached array views of a data frame: the owning frame, an int64 view of its
+# index, its values array, its index and its bar class
+_FrameArrays = namedtuple(
+    "_FrameArrays", ["frame", "idx_i8", "values", "index", "bar_type"]
+)
+
+# Result of a _check_data call
+CheckResult = namedtuple(
+    "CheckResult", ["strat_data", "current_bars", "quote_bars", "sufficient_data"]
+)
+
+# Shared result for updates without sufficient data, e.g. warmup bars
+_INSUFFICIENT = CheckResult(None, None, None, False)
+
+
+def _slice_end_left(idx_i8: np.ndarray, ts_i8: int) -> int:
+    """Returns the end index for slicing data indexed by bar open time."""
+    return np.searchsorted(idx_i8, ts_i8, side="left")
+
+
+def _slice_end_right(idx_i8: np.ndarray, ts_i8: int) -> int:
+    """Returns the end index for slicing data indexed by bar close time."""
+    return np.searchsorted(idx_i8, ts_i8, side="right")
+
+
+if njit is not None:
+    # Compile the slicing kernels to machine code
+    _slice_end_left = njit(cache=True)(_slice_end_left)
+    _slice_end_right = njit(cache=True)(_slice_end_right)
 
 
 class AutoTraderBot:
@@ -27,6 +65,9 @@ class AutoTraderBot:
         is available only after a backtest.
     """
 
+    # Cache of loaded strategy modules, keyed by (filepath, mtime)
+    _strategy_module_cache = {}
+
     def __init__(
         self,
         instrument: str,
@@ -72,8 +113,16 @@ class AutoTraderBot:
 
         """
         # Inherit user options from autotrader
-        for attribute, value in autotrader_instance.__dict__.items():
-            setattr(self, attribute, value)
+        self.__dict__.update(autotrader_instance.__dict__)
+
+        # Cast verbosity and notify levels to int once
+        self._verbosity = int(self._verbosity)
+        self._notify = int(self._notify)
+
+        # Pre-evaluate the order notification gate
+        self._order_notifications = self._notify > 0 and not (
+            self._backtest_mode or self._scan_mode
+        )
 
         # Assign local attributes
         self.instrument = instrument
@@ -118,43 +167,37 @@ class AutoTraderBot:
         strategy_config = strategy_dict["config"]
         interval = strategy_config["INTERVAL"]
         period = strategy_config["PERIOD"]
-        risk_pc = strategy_config["RISK_PC"] if "RISK_PC" in strategy_config else None
-        sizing = strategy_config["SIZING"] if "SIZING" in strategy_config else None
-        params = (
-            strategy_config["PARAMETERS"] if "PARAMETERS" in strategy_config else {}
-        )
+        params = strategy_config.get("PARAMETERS", {})
         strategy_params = params
-        strategy_params["granularity"] = (
-            strategy_params["granularity"]
-            if "granularity" in strategy_params
-            else interval
-        )
-        strategy_params["risk_pc"] = (
-            strategy_params["risk_pc"] if "risk_pc" in strategy_params else risk_pc
-        )
-        strategy_params["sizing"] = (
-            strategy_params["sizing"] if "sizing" in strategy_params else sizing
-        )
-        strategy_params["period"] = (
-            strategy_params["period"] if "period" in strategy_params else period
-        )
-        strategy_params["INCLUDE_POSITIONS"] = (
-            strategy_config["INCLUDE_POSITIONS"]
-            if "INCLUDE_POSITIONS" in strategy_config
-            else False
-        )
-        strategy_config["INCLUDE_BROKER"] = (
-            strategy_config["INCLUDE_BROKER"]
-            if "INCLUDE_BROKER" in strategy_config
-            else False
-        )
-        strategy_config["INCLUDE_STREAM"] = (
-            strategy_config["INCLUDE_STREAM"]
-            if "INCLUDE_STREAM" in strategy_config
-            else False
+        strategy_params.setdefault("granularity", interval)
+        strategy_params.setdefault("risk_pc", strategy_config.get("RISK_PC"))
+        strategy_params.setdefault("sizing", strategy_config.get("SIZING"))
+        strategy_params.setdefault("period", period)
+        strategy_params["INCLUDE_POSITIONS"] = strategy_config.get(
+            "INCLUDE_POSITIONS", False
         )
+        strategy_config.setdefault("INCLUDE_BROKER", False)
+        strategy_config.setdefault("INCLUDE_STREAM", False)
         self._strategy_params = strategy_params
 
+        # Pre-split the granularity string
+        self._granularities = tuple(strategy_params["granularity"].split(","))
+        self._base_granularity = self._granularities[0]
+
+        # Cache per-bar invariants of the update path
+        self._no_bars = strategy_params["period"]
+        self._check_for_future_data = bool(self._backtest_mode)
+
+        # Base granularity duration, used to rate-limit live data refreshes
+        try:
+            self._granularity_seconds = pd.Timedelta(
+                self._base_granularity
+            ).total_seconds()
+        except ValueError:
+            # Non-timedelta granularity (eg. tick data)
+            self._granularity_seconds = None
+        self._last_refresh_ts = None
+
         # Import Strategy
         if strategy_dict["class"] is not None:
             strategy = strategy_dict["class"]
@@ -163,17 +206,27 @@ class AutoTraderBot:
             strat_name = strategy_config["CLASS"]
             strat_package_path = os.path.join(self._home_dir, "strategies")
             strat_module_path = os.path.join(strat_package_path, strat_module) + ".py"
-            strat_spec = importlib.util.spec_from_file_location(
-                strat_module, strat_module_path
-            )
-            strategy_module = importlib.util.module_from_spec(strat_spec)
-            strat_spec.loader.exec_module(strategy_module)
+            cache_key = (strat_module_path, os.path.getmtime(strat_module_path))
+            strategy_module = AutoTraderBot._strategy_module_cache.get(cache_key)
+            if strategy_module is None:
+                # Module not yet loaded (or modified since); load and cache it
+                strat_spec = importlib.util.spec_from_file_location(
+                    strat_module, strat_module_path
+                )
+                strategy_module = importlib.util.module_from_spec(strat_spec)
+                strat_spec.loader.exec_module(strategy_module)
+                AutoTraderBot._strategy_module_cache[cache_key] = strategy_module
             strategy = getattr(strategy_module, strat_name)
 
         # Strategy shutdown routine
         self._strategy_shutdown_method = strategy_dict["shutdown_method"]
 
         # Get data feed configuration
+        # Deferred import to avoid loading the data modules until a bot
+        # is actually instantiated
+        from autotrader.autodata import AutoData
+        from autotrader.utilities import get_data_config
+
         data_config = get_data_config(
             feed=self._feed,
             global_config=self._global_config_dict,
@@ -201,6 +254,11 @@ class AutoTraderBot:
             data_config, self._allow_dancing_bears, self._base_currency
         )
 
+        # Cache the feed-specific live price method
+        self._liveprice_func = getattr(
+            self._get_data, f"_{self._feed.lower()}_liveprice", None
+        )
+
         # Create instance of data stream object
         stream_attributes = {
             "data_filepaths": self._data_filepaths,
@@ -219,6 +277,14 @@ class AutoTraderBot:
         }
         self.Stream = self._data_stream_object(**stream_attributes)
 
+        # Check whether the stream uses the default bar extraction, in which
+        # case quote bars can be built directly from cached data arrays
+        from autotrader.utilities import DataStream
+
+        self._default_trading_bars = (
+            type(self.Stream).get_trading_bars is DataStream.get_trading_bars
+        )
+
         # Initial data call
         self._refresh_data(deploy_dt)
 
@@ -238,8 +304,16 @@ class AutoTraderBot:
 
         my_strat = strategy(**strategy_inputs)
 
+        # Specialise the update method for the configured run mode
+        self._update = (
+            self._update_continuous
+            if self._run_mode.lower() == "continuous"
+            else self._update_periodic
+        )
+
         # Assign strategy to local attributes
-        self._last_bars = None
+        self._last_bar_ts = None
+        self._last_bar_vals = None
         self._strategy = my_strat
         self._strategy_name = (
             strategy_config["NAME"]
@@ -251,7 +325,7 @@ class AutoTraderBot:
         if self._backtest_mode:
             self._strategy._backtesting = True
             self.trade_results = None
-        if interval.split(",")[0] == "tick":
+        if self._base_granularity == "tick":
             self._strategy._tick_data = True
 
     def __repr__(self):
@@ -264,38 +338,58 @@ class AutoTraderBot:
     def __str__(self):
         return "AutoTraderBot instance"
 
-    def _update(self, i: int = None, timestamp: datetime = None) -> None:
-        """Update strategy with the latest data and generate a trade signal.
+    def _update_continuous(self, timestamp: datetime = None) -> None:
+        """Update strategy with the latest data and generate a trade signal,
+        when running in continuous update mode.
 
         Parameters
         ----------
-        i : int, optional
-            The indexing parameter used when running in periodic update mode.
-            The default is None.
         timestamp : datetime, optional
-            The timestamp parameter used when running in continuous update
-            mode. The default is None.
+            The current update timestamp. The default is None.
 
         Returns
         -------
         None
             Trade signals generated will be submitted to the broker.
         """
+        strat_data, current_bars, quote_bars, sufficient_data = self._check_data(
+            timestamp, self._data_indexing
+        )
+        self._process_update(strat_data, current_bars, quote_bars, sufficient_data)
 
-        if self._run_mode == "continuous":
-            # Running in continuous update mode
-            strat_data, current_bars, quote_bars, sufficient_data = self._check_data(
-                timestamp, self._data_indexing
-            )
-            strat_object = strat_data
+    def _update_periodic(self, i: int = None) -> None:
+        """Update strategy with the latest data and generate a trade signal,
+        when running in periodic update mode.
 
-        else:
-            # Running in periodic update mode
-            current_bars = {self.instrument: self.data.iloc[i]}
-            quote_bars = {self.instrument: self.quote_data.iloc[i]}
-            sufficient_data = True
-            strat_object = i
+        Parameters
+        ----------
+        i : int, optional
+            The data indexing parameter. The default is None.
+
+        Returns
+        -------
+        None
+            Trade signals generated will be submitted to the broker.
+        """
+        # Build bars from cached arrays
+        current_bars = {
+            self.instrument: self._data_bar_type(
+                *self._data_values[i], self._data_index[i]
+            )
+        }
+        quote_bars = {
+            self.instrument: self._quote_bar_type(
+                *self._quote_values[i], self._quote_index[i]
+            )
+        }
+        self._process_update(i, current_bars, quote_bars, True)
 
+    def _process_update(
+        self, strat_object, current_bars: dict, quote_bars: dict, sufficient_data: bool
+    ) -> None:
+        """Passes the latest data to the strategy and processes any trade
+        signals generated.
+        """
         # Check for new data
         new_data = self._check_last_bar(current_bars)
 
@@ -355,54 +449,54 @@ class AutoTraderBot:
                 # Update virtual broker again to trigger any orders
                 self._update_virtual_broker(current_bars)
 
-            if int(self._verbosity) > 1:
+            if self._verbosity > 1:
+                # Format the bar time once; all orders share the bar's time
                 try:
-                    current_time = current_bars[
-                        list(current_bars.keys())[0]
-                    ].name.strftime("%b %d %Y %H:%M:%S")
+                    current_time = next(iter(current_bars.values())).name.strftime(
+                        "%b %d %Y %H:%M:%S"
+                    )
                 except:
                     current_time = datetime.now().strftime("%b %d %Y %H:%M:%S")
                 if len(orders) > 0:
                     for order in orders:
                         direction = "long" if order.direction > 0 else "short"
-                        order_string = (
+                        print(
                             f"{current_time}: {order.instrument} "
-                            + f"{direction} {order.order_type} order of "
-                            + f"{order.size} units placed."
+                            f"{direction} {order.order_type} order of "
+                            f"{order.size} units placed."
                         )
-                        print(order_string)
                 else:
-                    if int(self._verbosity) > 2:
+                    if self._verbosity > 2:
                         print(
                             f"{current_time}: No signal detected ({self.instrument})."
                         )
 
             # Check for orders placed and/or scan hits
-            if int(self._notify) > 0 and not (self._backtest_mode or self._scan_mode):
+            if self._order_notifications:
                 for order in orders:
                     self._notifier.send_order(order)
 
             # Check scan results
             if self._scan_mode:
                 # Report AutoScan results
-                if int(self._verbosity) > 0 or int(self._notify) == 0:
-                    # Scan reporting with no notifications requested
-                    if len(orders) == 0:
-                        print("{}: No signal detected.".format(self.instrument))
+                report_hits = self._verbosity > 0 or self._notify == 0
+                notify_hits = self._notify > 0
+                if len(orders) == 0:
+                    if report_hits:
+                        print(f"{self.instrument}: No signal detected.")
 
-                    else:
-                        # Scan detected hits
+                else:
+                    # Scan detected hits; report and notify in a single pass
+                    if report_hits:
                         print("Scan hits:")
-                        for order in orders:
-                            print(order)
-
-                if int(self._notify) > 0:
-                    # Notifications requested
                     for order in orders:
-                        self._notifier.send_message(f"Scan hit: {order}")
+                        if report_hits:
+                            print(order)
+                        if notify_hits:
+                            self._notifier.send_message(f"Scan hit: {order}")
 
         else:
-            if int(self._verbosity) > 1:
+            if self._verbosity > 1:
                 print(
                     "\nThe strategy has not been updated as there is either "
                     + "insufficient data, or no new data. If you believe "
@@ -452,6 +546,22 @@ class AutoTraderBot:
         if self._feed != "none" and len(data) == 0:
             raise Exception("Error retrieving data.")
 
+        # Normalise the underlying value arrays to C order once, so that the
+        # cached arrays and the row slices handed downstream all have
+        # unit-stride access. Copies and aggregations can silently produce
+        # Fortran-ordered values
+        data = self._ensure_c_contiguous(data)
+        if isinstance(multi_data, dict):
+            multi_data = {
+                key: self._ensure_c_contiguous(item) for key, item in multi_data.items()
+            }
+        if isinstance(quote_data, dict):
+            quote_data = {
+                key: self._ensure_c_contiguous(item) for key, item in quote_data.items()
+            }
+        else:
+            quote_data = self._ensure_c_contiguous(quote_data)
+
         # Data assignment
         if multi_data is None:
             strat_data = data
@@ -462,13 +572,220 @@ class AutoTraderBot:
         if auxdata is not None:
             strat_data = {"base": strat_data, "aux": auxdata}
 
-        # Assign data attributes to bot
+        # Assign data attributes to bot, and resolve the strategy data shape
+        # once, rather than per update
         self._strat_data = strat_data
+        if isinstance(strat_data, dict):
+            self._process_strat_data = self._process_strat_data_mtf
+        elif isinstance(strat_data, pd.DataFrame):
+            self._process_strat_data = self._process_strat_data_df
+        elif strat_data is None:
+            self._process_strat_data = self._process_strat_data_none
+        else:
+            raise Exception("Unrecognised data type. Cannot process.")
         self.data = data
         self.multi_data = multi_data
         self.auxdata = auxdata
         self.quote_data = quote_data
 
+        # Classify auxiliary data entries once, so that _check_auxdata does
+        # not need to re-check types on every update
+        self._aux_classified = (
+            tuple(
+                (key, isinstance(item, (pd.DataFrame, pd.Series)))
+                for key, item in auxdata.items()
+            )
+            if auxdata is not None
+            else None
+        )
+
+        # Cache NumPy views of the data for fast bar access in periodic mode
+        (
+            self._data_values,
+            self._data_index,
+            self._data_bar_type,
+        ) = self._cache_bar_arrays(data)
+        (
+            self._quote_values,
+            self._quote_index,
+            self._quote_bar_type,
+        ) = self._cache_bar_arrays(quote_data)
+
+        # Cache int64 views of monotonic data indexes for fast slicing
+        self._cache_slice_indexes(data, multi_data, quote_data, auxdata)
+
+        # Resolve the aux/base split and pin the timeframe items once, so
+        # the per-update path iterates a tuple rather than re-probing dicts
+        has_aux = isinstance(strat_data, dict) and "aux" in strat_data
+        base = strat_data["base"] if has_aux else strat_data
+        self._strat_has_aux = has_aux
+        self._base_data = base
+        self._base_items = tuple(base.items()) if isinstance(base, dict) else None
+
+        # Check whether all timeframes share a common index, in which case a
+        # single slice cutoff serves every timeframe
+        if isinstance(base, dict) and len(base) > 1:
+            frames = list(base.values())
+            first_index = frames[0].index
+            self._mtf_shared_index = all(
+                frame.index.equals(first_index) for frame in frames[1:]
+            )
+        else:
+            self._mtf_shared_index = False
+
+        # Precompute backtest slice end indexes
+        self._precompute_end_indexes()
+
+    def _refresh_due(self, timestamp: datetime) -> bool:
+        """Returns True if the data stream is due to be refreshed at the
+        given timestamp. When duplicate bars are not allowed, refreshing
+        again within the same bar of the base granularity only fetches data
+        which will be discarded as a duplicate, so the fetch is skipped.
+        """
+        if self._granularity_seconds is None or self._allow_duplicate_bars:
+            return True
+        return (
+            self._last_refresh_ts is None
+            or pd.Timestamp(timestamp).timestamp() - self._last_refresh_ts
+            >= self._granularity_seconds
+        )
+
+    def _cache_slice_indexes(self, *datasets) -> None:
+        """Caches array views of each monotonic dataset, keyed by the
+        identity of the owning frame, for fast timestamp slicing and bar
+        construction. The frame is held in the cache entry to keep its
+        identity stable.
+        """
+        from autotrader.utilities import _bar_class
+
+        self._slice_cache = {}
+        for dataset in datasets:
+            items = dataset.values() if isinstance(dataset, dict) else [dataset]
+            for df in items:
+                if (
+                    isinstance(df, (pd.DataFrame, pd.Series))
+                    and df.index.is_monotonic_increasing
+                ):
+                    is_frame = isinstance(df, pd.DataFrame)
+                    self._slice_cache[id(df)] = _FrameArrays(
+                        frame=df,
+                        idx_i8=df.index.values.view("i8"),
+                        values=df.values if is_frame else None,
+                        index=df.index,
+                        bar_type=_bar_class(df.columns) if is_frame else None,
+                    )
+
+    def _cached_index(self, data) -> np.ndarray:
+        """Returns the cached int64 index view of a dataset, or None if the
+        dataset has not been cached.
+        """
+        entry = self._slice_cache.get(id(data))
+        return entry.idx_i8 if entry is not None else None
+
+    def _precompute_end_indexes(self) -> None:
+        """Precomputes the slice end index of each cached dataset for every
+        backtest timestep, reducing the per-update binary search to an array
+        lookup. This is only possible when backtesting static data, since the
+        update timestamps are then known in advance.
+        """
+        self._end_idx = None
+        if (
+            not self._backtest_mode
+            or self._dynamic_data
+            or self._timestep is None
+            or self._data_start is None
+            or self._data_end is None
+        ):
+            return
+
+        start_ns = pd.Timestamp(self._data_start + self._warmup_period).value
+        step_ns = int(self._timestep.total_seconds() * 1e9)
+        no_steps = (pd.Timestamp(self._data_end).value - start_ns) // step_ns + 1
+        if no_steps <= 0:
+            return
+
+        all_ts = start_ns + step_ns * np.arange(no_steps, dtype=np.int64)
+        side = "left" if self._data_indexing.lower() == "open" else "right"
+        self._end_idx_side = side
+        self._end_idx_start_ns = start_ns
+        self._end_idx_step_ns = step_ns
+        self._end_idx = {
+            key: np.searchsorted(entry.idx_i8, all_ts, side=side).astype(np.int32)
+            for key, entry in self._slice_cache.items()
+        }
+
+    def _precomputed_cutoff(self, data, timestamp, side: str) -> int:
+        """Returns the precomputed slice end index of a dataset at the given
+        backtest timestamp, or None if unavailable.
+        """
+        if self._end_idx is None or side != self._end_idx_side:
+            return None
+        end_idx = self._end_idx.get(id(data))
+        if end_idx is None:
+            return None
+        step, remainder = divmod(
+            pd.Timestamp(timestamp).value - self._end_idx_start_ns,
+            self._end_idx_step_ns,
+        )
+        if remainder or step < 0 or step >= len(end_idx):
+            return None
+        return int(end_idx[step])
+
+    def _quote_bars_from_cache(self, timestamp, indexing: str) -> dict:
+        """Builds the current quote bars directly from the cached quote data
+        arrays, without slicing the quote data frames. Returns None if the
+        quote data has not been cached, in which case the quote data must be
+        processed by slicing.
+        """
+        if isinstance(self.quote_data, dict):
+            items = self.quote_data.items()
+        else:
+            items = [(self.instrument, self.quote_data)]
+
+        slice_end = _slice_end_left if indexing.lower() == "open" else _slice_end_right
+        ts = pd.Timestamp(timestamp).value
+        quote_bars = {}
+        for instrument, df in items:
+            entry = self._slice_cache.get(id(df))
+            if entry is None or entry.values is None:
+                return None
+            if self._check_for_future_data:
+                cutoff = slice_end(entry.idx_i8, ts)
+            else:
+                cutoff = len(entry.idx_i8)
+            if cutoff == 0:
+                # No bars have passed yet
+                return None
+            quote_bars[instrument] = entry.bar_type(
+                *entry.values[cutoff - 1], entry.index[cutoff - 1]
+            )
+        return quote_bars
+
+    @staticmethod
+    def _ensure_c_contiguous(data):
+        """Returns the data with C-ordered underlying values, rebuilding the
+        frame only when its values are Fortran-ordered.
+        """
+        if isinstance(data, pd.DataFrame) and not data.values.flags.c_contiguous:
+            return pd.DataFrame(
+                np.ascontiguousarray(data.values),
+                index=data.index,
+                columns=data.columns,
+            )
+        return data
+
+    @staticmethod
+    def _cache_bar_arrays(data):
+        """Returns the underlying values array, index and bar class of a
+        DataFrame, used to construct bars without per-bar Series creation.
+        """
+        if isinstance(data, pd.DataFrame):
+            from autotrader.utilities import _bar_class
+
+            return data.values, data.index, _bar_class(data.columns)
+        else:
+            return None, None, None
+
     def _check_orders(self, orders) -> list:
         """Checks that orders returned from strategy are in the correct
         format.
@@ -484,104 +801,80 @@ class AutoTraderBot:
         types. If an order with no order type is provided, it will be ignored.
         """
 
-        def check_type(orders):
-            checked_orders = []
+        def iter_orders(orders):
+            # Normalise the strategy output to an iterable of order items
             if isinstance(orders, dict):
-                # Order(s) provided in dictionary
                 if "order_type" in orders:
                     # Single order dict provided
-                    if "instrument" not in orders:
-                        orders["instrument"] = self.instrument
-                    checked_orders.append(Order._from_dict(orders))
-
-                elif len(orders) > 0:
-                    # Multiple orders provided
-                    for key, item in orders.items():
-                        if isinstance(item, dict) and "order_type" in item:
-                            # Convert order dict to Order object
-                            if "instrument" not in item:
-                                item["instrument"] = self.instrument
-                            checked_orders.append(Order._from_dict(item))
-                        elif isinstance(item, Order):
-                            # Native Order object, append as is
-                            checked_orders.append(item)
-                        else:
-                            raise Exception(f"Invalid order submitted: {item}")
-
-                elif len(orders) == 0:
-                    # Empty order dict
-                    pass
+                    yield orders
+                else:
+                    # Multiple orders provided (possibly none)
+                    yield from orders.values()
 
             elif isinstance(orders, Order):
                 # Order object directly returned
-                checked_orders.append(orders)
+                yield orders
 
             elif isinstance(orders, list):
                 # Order(s) provided in list
-                for item in orders:
-                    if isinstance(item, dict) and "order_type" in item:
-                        # Convert order dict to Order object
-                        if "instrument" not in item:
-                            item["instrument"] = self.instrument
-                        checked_orders.append(Order._from_dict(item))
-                    elif isinstance(item, Order):
-                        # Native Order object, append as is
-                        checked_orders.append(item)
-                    else:
-                        raise Exception(f"Invalid order submitted: {item}")
+                yield from orders
+
             else:
                 raise Exception(f"Invalid order/s submitted: '{orders}' received")
 
-            return checked_orders
+        # Pre-bind strategy parameters shared by every order
+        strategy_name = (
+            self._strategy.name
+            if "name" in self._strategy.__dict__
+            else self._strategy_name
+        )
+        granularity = self._strategy_params["granularity"]
+        sizing = self._strategy_params["sizing"]
+        risk_pc = self._strategy_params["risk_pc"]
+
+        # Check, qualify and filter orders in a single pass
+        checked_orders = []
+        for item in iter_orders(orders):
+            if isinstance(item, dict) and "order_type" in item:
+                # Convert order dict to Order object
+                if "instrument" not in item:
+                    item["instrument"] = self.instrument
+                order = Order._from_dict(item)
+            elif isinstance(item, Order):
+                # Native Order object, use as is
+                order = item
+            else:
+                raise Exception(f"Invalid order submitted: {item}")
 
-        def add_strategy_data(orders):
-            # Append strategy parameters to each order
-            for order in orders:
-                order.instrument = (
-                    self.instrument if not order.instrument else order.instrument
-                )
-                order.strategy = (
-                    self._strategy.name
-                    if "name" in self._strategy.__dict__
-                    else self._strategy_name
-                )
-                order.granularity = self._strategy_params["granularity"]
-                order._sizing = self._strategy_params["sizing"]
-                order._risk_pc = self._strategy_params["risk_pc"]
+            # Append strategy parameters to the order
+            order.instrument = order.instrument if order.instrument else self.instrument
+            order.strategy = strategy_name
+            order.granularity = granularity
+            order._sizing = sizing
+            order._risk_pc = risk_pc
 
-        def check_order_details(orders: list) -> None:
             # Check details for order type have been provided
-            for ix, order in enumerate(orders):
-                order.instrument = (
-                    order.instrument
-                    if order.instrument is not None
-                    else self.instrument
-                )
-                if order.order_type in ["market", "limit", "stop-limit", "reduce"]:
-                    if not order.direction:
-                        # Order direction was not provided, delete order
-                        del orders[ix]
-                        continue
-
-                # Check that an exchange has been specified
-                if order.exchange is None:
-                    # Exchange not specified
-                    if self._multiple_brokers:
-                        # Trading across multiple venues
-                        raise Exception(
-                            "The exchange to which an order is to be "
-                            + "submitted must be specified when trading across "
-                            + "multiple venues. Please include the 'exchange' "
-                            + "argument when creating an order."
-                        )
-                    else:
-                        # Trading on single venue, auto fill
-                        order.exchange = self._broker_name
+            if order.order_type in _DIRECTIONAL_ORDER_TYPES:
+                if not order.direction:
+                    # Order direction was not provided, drop order
+                    continue
+
+            # Check that an exchange has been specified
+            if order.exchange is None:
+                # Exchange not specified
+                if self._multiple_brokers:
+                    # Trading across multiple venues
+                    raise Exception(
+                        "The exchange to which an order is to be "
+                        + "submitted must be specified when trading across "
+                        + "multiple venues. Please include the 'exchange' "
+                        + "argument when creating an order."
+                    )
+                else:
+                    # Trading on single venue, auto fill
+                    order.exchange = self._broker_name
 
-        # Perform checks
-        checked_orders = check_type(orders)
-        add_strategy_data(checked_orders)
-        check_order_details(checked_orders)
+            checked_orders.append(order)
 
         return checked_orders
 
@@ -608,10 +901,7 @@ class AutoTraderBot:
                 # Get order price from current bars
                 if self._req_liveprice:
                     # Fetch current price
-                    liveprice_func = getattr(
-                        self._get_data, f"_{self._feed.lower()}_liveprice"
-                    )
-                    last_price = liveprice_func(order)
+                    last_price = self._liveprice_func(order)
                 else:
                     # Fetch pseudo-current price
                     try:
@@ -666,6 +956,8 @@ class AutoTraderBot:
 
     def _create_trade_results(self, broker_histories: dict) -> dict:
         """Constructs bot-specific trade summary for post-processing."""
+        from autotrader.utilities import TradeAnalysis
+
         trade_results = TradeAnalysis(self._broker, broker_histories, self.instrument)
         trade_results.indicators = (
             self._strategy.indicators if hasattr(self._strategy, "indicators") else None
@@ -700,6 +992,8 @@ class AutoTraderBot:
         indexing: str = "open",
         tail_bars: int = None,
         check_for_future_data: bool = True,
+        cached_index: np.ndarray = None,
+        cutoff: int = None,
     ) -> pd.DataFrame:
         """Checks the index of inputted data to ensure it contains no future
         data.
@@ -718,6 +1012,13 @@ class AutoTraderBot:
             of bars specified. The default is None.
         check_for_future_data : bool, optional
             A flag to check for future entries in the data. The default is True.
+        cached_index : np.ndarray, optional
+            A cached int64 view of the (monotonic) data index, used to
+            search for the cutoff without touching the pandas index. The
+            default is None.
+        cutoff : int, optional
+            A precomputed slice end index, which skips the binary search
+            entirely. The default is None.
 
         Raises
         ------
@@ -732,11 +1033,32 @@ class AutoTraderBot:
         """
         if check_for_future_data:
             if indexing.lower() == "open":
-                past_data = ohlc_data[ohlc_data.index < timestamp]
+                side = "left"
             elif indexing.lower() == "close":
-                past_data = ohlc_data[ohlc_data.index <= timestamp]
+                side = "right"
             else:
                 raise Exception(f"Unrecognised indexing type '{indexing}'.")
+
+            if cutoff is not None:
+                start = 0 if tail_bars is None else max(0, cutoff - tail_bars)
+                return ohlc_data.iloc[start:cutoff]
+            elif cached_index is not None:
+                # Binary search the cached int64 index view directly
+                slice_end = _slice_end_left if side == "left" else _slice_end_right
+                cutoff = slice_end(cached_index, pd.Timestamp(timestamp).value)
+                start = 0 if tail_bars is None else max(0, cutoff - tail_bars)
+                return ohlc_data.iloc[start:cutoff]
+            elif ohlc_data.index.is_monotonic_increasing:
+                # Sorted index; binary search for the cutoff and slice to a view
+                cutoff = ohlc_data.index.searchsorted(timestamp, side=side)
+                start = 0 if tail_bars is None else max(0, cutoff - tail_bars)
+                return ohlc_data.iloc[start:cutoff]
+            else:
+                # Unsorted index; fall back to Boolean mask
+                if side == "left":
+                    past_data = ohlc_data[ohlc_data.index < timestamp]
+                else:
+                    past_data = ohlc_data[ohlc_data.index <= timestamp]
         else:
             past_data = ohlc_data
 
@@ -775,16 +1097,163 @@ class AutoTraderBot:
         dict
             The checked auxiliary data.
         """
+        side = "left" if indexing.lower() == "open" else "right"
         processed_auxdata = {}
-        for key, item in auxdata.items():
-            if isinstance(item, pd.DataFrame) or isinstance(item, pd.Series):
+        for key, is_timeseries in self._aux_classified:
+            item = auxdata[key]
+            if is_timeseries:
                 processed_auxdata[key] = self._check_ohlc_data(
-                    item, timestamp, indexing, tail_bars, check_for_future_data
+                    item,
+                    timestamp,
+                    indexing,
+                    tail_bars,
+                    check_for_future_data,
+                    self._cached_index(item),
+                    self._precomputed_cutoff(item, timestamp, side),
                 )
             else:
                 processed_auxdata[key] = item
         return processed_auxdata
 
+    def _get_current_bars(
+        self,
+        data: pd.DataFrame,
+        timestamp: datetime,
+        quote_data: bool = False,
+        processed_strategy_data: dict = None,
+    ) -> dict:
+        """Returns the current bars of data. If the inputted data is for
+        quote bars, then the quote_data boolean will be True.
+        """
+        if len(data) > 0:
+            current_bars = self.Stream.get_trading_bars(
+                data=data,
+                quote_bars=quote_data,
+                timestamp=timestamp,
+                processed_strategy_data=processed_strategy_data,
+            )
+        else:
+            current_bars = None
+        return current_bars
+
+    def _process_strat_data_mtf(
+        self, timestamp, indexing, side, no_bars, check_for_future_data
+    ):
+        """Processes dict-shaped strategy data (multi-timeframe and/or
+        auxiliary data).
+        """
+        has_aux = self._strat_has_aux
+        base_data = self._base_data
+        base_items = self._base_items
+
+        # Process base OHLC data
+        processed_basedata = {}
+        if base_items is not None:
+            # Base data is multi-timeframe; process the leading
+            # timeframe first, since it determines sufficiency
+            granularity, data = base_items[0]
+            cutoff = self._precomputed_cutoff(data, timestamp, side)
+            if cutoff is not None and cutoff < no_bars:
+                # Not enough bars yet; skip the slicing altogether
+                return None, None, False
+            first_tf_data = self._check_ohlc_data(
+                data,
+                timestamp,
+                indexing,
+                no_bars,
+                check_for_future_data,
+                self._cached_index(data),
+                cutoff,
+            )
+            if cutoff is None and len(first_tf_data) < no_bars:
+                # Not enough bars yet; skip the remaining timeframes
+                return None, None, False
+            processed_basedata[granularity] = first_tf_data
+            shared_cutoff = cutoff if self._mtf_shared_index else None
+            for granularity, data in base_items[1:]:
+                processed_basedata[granularity] = self._check_ohlc_data(
+                    data,
+                    timestamp,
+                    indexing,
+                    no_bars,
+                    check_for_future_data,
+                    self._cached_index(data),
+                    (
+                        shared_cutoff
+                        if shared_cutoff is not None
+                        else self._precomputed_cutoff(data, timestamp, side)
+                    ),
+                )
+        elif isinstance(base_data, (pd.DataFrame, pd.Series)):
+            # Base data is a timeseries already, check directly
+            processed_basedata = self._check_ohlc_data(
+                base_data,
+                timestamp,
+                indexing,
+                no_bars,
+                check_for_future_data,
+                self._cached_index(base_data),
+                self._precomputed_cutoff(base_data, timestamp, side),
+            )
+            first_tf_data = processed_basedata[next(iter(processed_basedata))]
+            if len(first_tf_data) < no_bars:
+                return None, None, False
+
+        # Process auxiliary data
+        if has_aux:
+            processed_auxdata = self._check_auxdata(
+                self._strat_data["aux"],
+                timestamp,
+                indexing,
+                no_bars,
+                check_for_future_data,
+            )
+
+        # Combine the results of the conditionals above
+        strat_data = (
+            {"aux": processed_auxdata, "base": processed_basedata}
+            if has_aux
+            else processed_basedata
+        )
+
+        # Extract current bar
+        current_bars = self._get_current_bars(
+            first_tf_data, timestamp, processed_strategy_data=strat_data
+        )
+        return strat_data, current_bars, True
+
+    def _process_strat_data_df(
+        self, timestamp, indexing, side, no_bars, check_for_future_data
+    ):
+        """Processes single-timeframe strategy data."""
+        original_strat_data = self._strat_data
+        cutoff = self._precomputed_cutoff(original_strat_data, timestamp, side)
+        if cutoff is not None and cutoff < no_bars:
+            # Not enough bars yet; skip the slicing altogether
+            return None, None, False
+        strat_data = self._check_ohlc_data(
+            original_strat_data,
+            timestamp,
+            indexing,
+            no_bars,
+            check_for_future_data,
+            self._cached_index(original_strat_data),
+            cutoff,
+        )
+        if cutoff is None and len(strat_data) < no_bars:
+            # Not enough bars yet; skip the bar extraction
+            return None, None, False
+        current_bars = self._get_current_bars(
+            strat_data, timestamp, processed_strategy_data=strat_data
+        )
+        return strat_data, current_bars, True
+
+    def _process_strat_data_none(
+        self, timestamp, indexing, side, no_bars, check_for_future_data
+    ):
+        """Processes 'none' strategy data."""
+        return None, {}, True
+
     def _check_data(self, timestamp: datetime, indexing: str = "open") -> dict:
         """Function to return trading data based on the current timestamp. If
         dynamc_data updates are required (eg. when livetrading), the
@@ -812,177 +1281,121 @@ class AutoTraderBot:
 
         """
 
-        def get_current_bars(
-            data: pd.DataFrame,
-            quote_data: bool = False,
-            processed_strategy_data: dict = None,
-        ) -> dict:
-            """Returns the current bars of data. If the inputted data is for
-            quote bars, then the quote_data boolean will be True.
-            """
-            if len(data) > 0:
-                current_bars = self.Stream.get_trading_bars(
-                    data=data,
-                    quote_bars=quote_data,
-                    timestamp=timestamp,
-                    processed_strategy_data=processed_strategy_data,
-                )
-            else:
-                current_bars = None
-            return current_bars
-
-        def process_strat_data(original_strat_data, check_for_future_data):
-            sufficient_data = True
-
-            if isinstance(original_strat_data, dict):
-                if "aux" in original_strat_data:
-                    # Auxiliary data is being used
-                    base_data = original_strat_data["base"]
-                    processed_auxdata = self._check_auxdata(
-                        original_strat_data["aux"],
-                        timestamp,
-                        indexing,
-                        no_bars,
-                        check_for_future_data,
-                    )
-                else:
-                    # MTF data
-                    base_data = original_strat_data
-
-                # Process base OHLC data
-                processed_basedata = {}
-                if isinstance(base_data, dict):
-                    # Base data is multi-timeframe; process each timeframe
-                    for granularity, data in base_data.items():
-                        processed_basedata[granularity] = self._check_ohlc_data(
-                            data, timestamp, indexing, no_bars, check_for_future_data
-                        )
-                elif isinstance(base_data, pd.DataFrame) or isinstance(
-                    base_data, pd.Series
-                ):
-                    # Base data is a timeseries already, check directly
-                    processed_basedata = self._check_ohlc_data(
-                        base_data, timestamp, indexing, no_bars, check_for_future_data
-                    )
-
-                # Combine the results of the conditionals above
-                strat_data = {}
-                if "aux" in original_strat_data:
-                    strat_data["aux"] = processed_auxdata
-                    strat_data["base"] = processed_basedata
-                else:
-                    strat_data = processed_basedata
-
-                # Extract current bar
-                first_tf_data = processed_basedata[list(processed_basedata.keys())[0]]
-                current_bars = get_current_bars(
-                    first_tf_data, processed_strategy_data=strat_data
-                )
-
-                # Check that enough bars have accumulated
-                if len(first_tf_data) < no_bars:
-                    sufficient_data = False
+        # Minimum number of bars for strategy to run
+        no_bars = self._no_bars
+        check_for_future_data = self._check_for_future_data
+        side = "left" if indexing.lower() == "open" else "right"
 
-            elif isinstance(original_strat_data, pd.DataFrame):
-                strat_data = self._check_ohlc_data(
-                    original_strat_data,
-                    timestamp,
-                    indexing,
-                    no_bars,
-                    check_for_future_data,
-                )
-                current_bars = get_current_bars(
-                    strat_data, processed_strategy_data=strat_data
-                )
-
-                # Check that enough bars have accumulated
-                if len(strat_data) < no_bars:
-                    sufficient_data = False
-
-            elif original_strat_data is None:
-                # Using none data
-                strat_data = None
-                current_bars = {}
-                sufficient_data = True
-
-            else:
-                raise Exception("Unrecognised data type. Cannot process.")
-
-            return strat_data, current_bars, sufficient_data
-
-        # Define minimum number of bars for strategy to run
-        no_bars = self._strategy_params["period"]
-
-        if self._backtest_mode:
-            check_for_future_data = True
-            if self._dynamic_data:
+        if not self._backtest_mode:
+            # Livetrading; skip the refresh if the current bar has not
+            # closed since the last one
+            if self._refresh_due(timestamp):
                 self._refresh_data(timestamp)
-        else:
-            # Livetrading
+                self._last_refresh_ts = pd.Timestamp(timestamp).timestamp()
+        elif self._dynamic_data:
+            # Backtesting with dynamic data updates
             self._refresh_data(timestamp)
-            check_for_future_data = False
 
-        strat_data, current_bars, sufficient_data = process_strat_data(
-            self._strat_data, check_for_future_data
+        strat_data, current_bars, sufficient_data = self._process_strat_data(
+            timestamp, indexing, side, no_bars, check_for_future_data
         )
 
+        if not sufficient_data:
+            # Not enough bars have accumulated yet; the caller will discard
+            # the data, so skip the quote data processing
+            return _INSUFFICIENT
+
         # Process quote data
+        if self._default_trading_bars and self.quote_data is not None:
+            # Quote data is only used for bar extraction, so when the default
+            # extraction method is in use, build the bars directly from the
+            # cached arrays instead of slicing the quote data frames
+            quote_bars = self._quote_bars_from_cache(timestamp, indexing)
+            if quote_bars is not None:
+                return CheckResult(strat_data, current_bars, quote_bars, True)
+
         if isinstance(self.quote_data, dict):
-            processed_quote_data = {}
-            for instrument in self.quote_data:
-                processed_quote_data[instrument] = self._check_ohlc_data(
-                    self.quote_data[instrument],
+            processed_quote_data = {
+                instrument: self._check_ohlc_data(
+                    data,
                     timestamp,
                     indexing,
                     no_bars,
                     check_for_future_data,
+                    self._cached_index(data),
+                    self._precomputed_cutoff(data, timestamp, side),
                 )
-            quote_data = processed_quote_data[instrument]  # Dummy
+                for instrument, data in self.quote_data.items()
+            }
+            quote_data = next(reversed(processed_quote_data.values()))  # Dummy
 
         elif isinstance(self.quote_data, pd.DataFrame):
             quote_data = self._check_ohlc_data(
-                self.quote_data, timestamp, indexing, no_bars, check_for_future_data
+                self.quote_data,
+                timestamp,
+                indexing,
+                no_bars,
+                check_for_future_data,
+                self._cached_index(self.quote_data),
+                self._precomputed_cutoff(self.quote_data, timestamp, side),
             )
             processed_quote_data = {self.instrument: quote_data}
 
         elif self.quote_data is None:
             # Using 'none' data feed
-            quote_bars = current_bars
-            return strat_data, current_bars, quote_bars, sufficient_data
+            return CheckResult(strat_data, current_bars, current_bars, True)
 
         else:
             raise Exception("Unrecognised data type. Cannot process.")
 
         # Get quote bars
-        quote_bars = get_current_bars(quote_data, True, processed_quote_data)
+        quote_bars = self._get_current_bars(
+            quote_data, timestamp, True, processed_quote_data
+        )
 
-        return strat_data, current_bars, quote_bars, sufficient_data
+        return CheckResult(strat_data, current_bars, quote_bars, True)
 
     def _check_last_bar(self, current_bars: dict) -> bool:
         """Checks for new data to prevent duplicate signals."""
+        current_bar_ts = None
+        current_bar_vals = None
         if self._allow_duplicate_bars:
             new_data = True
         else:
             try:
-                duplicated_bars = []
+                # Compare bar timestamps (as int64 nanoseconds) to the
+                # previous update, rather than comparing full bars
+                current_bar_ts = {}
+                current_bar_vals = {}
                 for product, bar in current_bars.items():
-                    if (bar == self._last_bars[product]).all():
-                        duplicated_bars.append(True)
-                    else:
-                        duplicated_bars.append(False)
-
-                if len(duplicated_bars) == sum(duplicated_bars):
-                    new_data = False
-                else:
-                    new_data = True
+                    ts = bar.name
+                    current_bar_ts[product] = ts.value if hasattr(ts, "value") else ts
+                    # Store bar values as raw bytes, so that the comparison
+                    # below is a single memcmp per product
+                    vals = getattr(bar, "values", None)
+                    if vals is None:
+                        # Bars are namedtuples; drop the trailing bar time
+                        vals = bar[:-1]
+                    current_bar_vals[product] = np.ascontiguousarray(
+                        vals, dtype=np.float64
+                    ).tobytes()
+                new_data = current_bar_ts != self._last_bar_ts
+
+                if not new_data:
+                    # Timestamps unchanged; confirm values also are, to
+                    # catch bars which have been updated in place
+                    new_data = current_bar_vals != self._last_bar_vals
 
             except:
+                current_bar_ts = None
+                current_bar_vals = None
                 new_data = True
 
-        # Reset last bars
-        self._last_bars = current_bars
+        # Reset last bar timestamps and values
+        self._last_bar_ts = current_bar_ts
+        self._last_bar_vals = current_bar_vals
 
-        if int(self._verbosity) > 1 and not new_data:
+        if self._verbosity > 1 and not new_data:
             print("Duplicate bar detected. Skipping.")
 
         return new_data
@@ -1031,6 +1444,13 @@ class AutoTraderBot:
         self.data = data
         self._strategy.data = data
 
+        # Refresh cached bar arrays
+        (
+            self._data_values,
+            self._data_index,
+            self._data_bar_type,
+        ) = self._cache_bar_arrays(data)
+
     @staticmethod
     def _submit_order(broker, order, *args, **kwargs):
         "The default order execution method."
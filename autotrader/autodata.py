@@ -1078,7 +1078,14 @@ class AutoData:
         """Checks and returns the dataset matching the backtest start and
         end dates (as close as possible).
         """
-        return data[(data.index >= start_date) & (data.index <= end_date)]
+        if data.index.is_monotonic_increasing:
+            # Sorted index; slice between binary-searched bounds
+            start = data.index.searchsorted(start_date, side="left")
+            end = data.index.searchsorted(end_date, side="right")
+            return data.iloc[start:end]
+        else:
+            # Unsorted index; fall back to Boolean mask
+            return data[(data.index >= start_date) & (data.index <= end_date)]
 
     def _ccxt(
         self,
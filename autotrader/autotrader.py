@@ -1892,16 +1892,14 @@ class AutoTrader:
         # Construct list of bot data
         data = [bot.data for bot in self._bots_deployed]
 
-        for i, dat in enumerate(data):
-            # Initialise common index
-            comm_index = dat.index
-
-            # Update common index by intersection with other data
-            for j, dat_2 in enumerate(data):
-                comm_index = comm_index.intersection(dat_2.index)
+        # Find the index common to all bot data
+        comm_index = data[0].index
+        for dat in data[1:]:
+            comm_index = comm_index.intersection(dat.index)
 
-            # Adjust bot data using common indexes
-            adj_data = dat[dat.index.isin(comm_index)]
+        for i, dat in enumerate(data):
+            # Adjust bot data using common index found
+            adj_data = dat.loc[comm_index]
 
             # Re-assign bot data
             self._bots_deployed[i]._replace_data(adj_data)
@@ -6,10 +6,48 @@ import autotrader
 import numpy as np
 import pandas as pd
 from art import tprint
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from autotrader.brokers.broker import AbstractBroker
 from prometheus_client import start_http_server, Gauge
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _drawdown(nav: np.ndarray) -> np.ndarray:
+    """Returns the drawdown of a NAV array in a single pass."""
+    out = np.empty_like(nav)
+    if nav.size == 0:
+        return out
+    peak = nav[0]
+    for i in range(nav.size):
+        if nav[i] > peak:
+            peak = nav[i]
+        out[i] = nav[i] / peak - 1.0
+    return out
+
+
+if njit is not None:
+    # JIT-compile the drawdown kernel when Numba is available
+    _drawdown = njit(cache=True)(_drawdown)
+else:
+    # No Numba; use vectorised NumPy instead of the Python loop
+    def _drawdown(nav: np.ndarray) -> np.ndarray:
+        """Returns the drawdown of a NAV array."""
+        return nav / np.maximum.accumulate(nav) - 1.0
+
+
+def _bar_class(columns) -> type:
+    """Returns a lightweight namedtuple class representing a single bar of
+    data, with an additional 'name' field holding the bar's timestamp to
+    mirror the pd.Series API.
+    """
+    return namedtuple("Bar", [*columns, "name"], rename=True)
+
 
 def read_yaml(file_path: str) -> dict:
     """Function to read and extract contents from .yaml file.
@@ -443,10 +481,11 @@ class TradeAnalysis:
                 fills=broker._fills, broker_name=broker_name
             )
 
+            hist_dict = broker_histories[broker_name]
             account_history = pd.DataFrame(
-                data=broker_histories[broker_name],
+                data={key: hist_dict[key] for key in hist_dict if key != "time"},
+                index=pd.Index(hist_dict["time"], name="time"),
             )
-            account_history.set_index("time", inplace=True)
 
             position_history = TradeAnalysis.create_position_history(
                 trade_history=trade_history,
@@ -458,8 +497,8 @@ class TradeAnalysis:
             )
 
             # Calculate drawdown
-            account_history["drawdown"] = (
-                account_history.NAV / account_history.NAV.cummax() - 1
+            account_history["drawdown"] = _drawdown(
+                np.ascontiguousarray(account_history.NAV.values, dtype=np.float64)
             )
 
             # Save results for this broker instance
@@ -1065,6 +1104,15 @@ class DataStream:
         for item in kwargs:
             setattr(self, item, kwargs[item])
 
+        # Cache of bar classes, keyed by data columns
+        self._bar_type_cache = {}
+
+        # Pre-split the granularity string
+        if self.strategy_params is not None:
+            self._granularities = tuple(self.strategy_params["granularity"].split(","))
+        else:
+            self._granularities = None
+
     def refresh(self, timestamp: datetime = None):
         """Returns up-to-date trading data for AutoBot to provide to the
         strategy.
@@ -1090,14 +1138,17 @@ class DataStream:
             Strategy auxiliary data.
 
         """
+        # Hoist invariant lookups used in the retrieval loops below
+        get_local = self.get_data._local
+        data_start = self.data_start
+        data_end = self.data_end
+
         # Retrieve main data
         if self.data_filepaths is not None:
             # Local data filepaths provided
             if isinstance(self.data_filepaths, str):
                 # Single data filepath provided
-                data = self.get_data._local(
-                    self.data_filepaths, self.data_start, self.data_end
-                )
+                data = get_local(self.data_filepaths, data_start, data_end)
                 multi_data = None
 
             elif isinstance(self.data_filepaths, dict):
@@ -1105,16 +1156,14 @@ class DataStream:
                 multi_data = {}
                 if self.portfolio:
                     for instrument, filepath in self.data_filepaths.items():
-                        data = self.get_data._local(
-                            filepath, self.data_start, self.data_end
+                        multi_data[instrument] = get_local(
+                            filepath, data_start, data_end
                         )
-                        multi_data[instrument] = data
                 else:
                     for granularity, filepath in self.data_filepaths.items():
-                        data = self.get_data._local(
-                            filepath, self.data_start, self.data_end
+                        multi_data[granularity] = get_local(
+                            filepath, data_start, data_end
                         )
-                        multi_data[granularity] = data
 
                 # Extract first dataset as base data (arbitrary)
                 data = multi_data[list(self.data_filepaths.keys())[0]]
@@ -1129,16 +1178,16 @@ class DataStream:
                     filepath = self.data_path_mapper(instrument)
 
                     # Save to multidata dict
-                    data = self.get_data._local(
-                        filepath, self.data_start, self.data_end
-                    )
-                    multi_data[instrument] = data
+                    multi_data[instrument] = get_local(filepath, data_start, data_end)
+
+                # Extract first dataset as base data (arbitrary)
+                data = multi_data[self.portfolio[0]]
 
             else:
                 # Single instrument strategy
                 filepath = self.data_path_mapper(self.instrument)
                 granularity = self.strategy_params["granularity"]
-                data = self.get_data._local(filepath, self.data_start, self.data_end)
+                data = get_local(filepath, data_start, data_end)
                 multi_data = None
 
         else:
@@ -1149,16 +1198,29 @@ class DataStream:
                 # Portfolio strategy
                 if len(self.portfolio) > 1:
                     granularity = self.strategy_params["granularity"]
+                    period = self.strategy_params["period"]
                     data_key = self.portfolio[0]
-                    for instrument in self.portfolio:
-                        data = data_func(
-                            instrument,
-                            granularity=granularity,
-                            count=self.strategy_params["period"],
-                            start_time=self.data_start,
-                            end_time=self.data_end,
-                        )
-                        multi_data[instrument] = data
+
+                    # Fetch each instrument concurrently, so that the total
+                    # latency is that of the slowest fetch rather than the sum
+                    with ThreadPoolExecutor(
+                        max_workers=len(self.portfolio)
+                    ) as executor:
+                        futures = {
+                            instrument: executor.submit(
+                                data_func,
+                                instrument,
+                                granularity=granularity,
+                                count=period,
+                                start_time=data_start,
+                                end_time=data_end,
+                            )
+                            for instrument in self.portfolio
+                        }
+                    multi_data = {
+                        instrument: future.result()
+                        for instrument, future in futures.items()
+                    }
                 else:
                     raise Exception(
                         "Portfolio strategies require more "
@@ -1168,17 +1230,35 @@ class DataStream:
                     )
             else:
                 # Single instrument strategy
-                granularities = self.strategy_params["granularity"].split(",")
+                granularities = self._granularities
+                period = self.strategy_params["period"]
                 data_key = granularities[0]
-                for granularity in granularities:
-                    data = data_func(
+                if len(granularities) > 1:
+                    # Fetch each granularity concurrently
+                    with ThreadPoolExecutor(max_workers=len(granularities)) as executor:
+                        futures = {
+                            granularity: executor.submit(
+                                data_func,
+                                self.instrument,
+                                granularity=granularity,
+                                count=period,
+                                start_time=data_start,
+                                end_time=data_end,
+                            )
+                            for granularity in granularities
+                        }
+                    multi_data = {
+                        granularity: future.result()
+                        for granularity, future in futures.items()
+                    }
+                else:
+                    multi_data[data_key] = data_func(
                         self.instrument,
-                        granularity=granularity,
-                        count=self.strategy_params["period"],
-                        start_time=self.data_start,
-                        end_time=self.data_end,
+                        granularity=data_key,
+                        count=period,
+                        start_time=data_start,
+                        end_time=data_end,
                     )
-                    multi_data[granularity] = data
 
             # Take data as first element of multi-data
             data = multi_data[data_key]
@@ -1233,7 +1313,7 @@ class DataStream:
                 quote_data = quote_data_func(
                     data,
                     self.instrument,
-                    self.strategy_params["granularity"].split(",")[0],
+                    self._granularities[0],
                     self.data_start,
                     self.data_end,
                     count=self.strategy_params["period"],
@@ -1279,24 +1359,12 @@ class DataStream:
         self, data: pd.DataFrame, quote_data: pd.DataFrame
     ) -> pd.DataFrame:
         """Function to match index of trading data and quote data."""
-        datasets = [data, quote_data]
-        adjusted_datasets = []
-
-        for dataset in datasets:
-            # Initialise common index
-            common_index = dataset.index
+        # Find the index common to both datasets
+        common_index = data.index.intersection(quote_data.index, sort=False)
 
-            # Update common index by intersection with other data
-            for other_dataset in datasets:
-                common_index = common_index.intersection(other_dataset.index)
-
-            # Adjust data using common index found
-            adj_data = dataset[dataset.index.isin(common_index)]
-
-            adjusted_datasets.append(adj_data)
-
-        # Unpack adjusted datasets
-        adj_data, adj_quote_data = adjusted_datasets
+        # Adjust data using common index found
+        adj_data = data.loc[common_index]
+        adj_quote_data = quote_data.loc[common_index]
 
         return adj_data, adj_quote_data
 
@@ -1339,12 +1407,29 @@ class DataStream:
         )
         if isinstance(strat_data, dict):
             for instrument, data in strat_data.items():
-                bars[instrument] = data.iloc[-1]
+                bars[instrument] = self._build_bar(data)
         else:
-            bars[self.instrument] = strat_data.iloc[-1]
+            bars[self.instrument] = self._build_bar(strat_data)
 
         return bars
 
+    def _build_bar(self, data: pd.DataFrame):
+        """Constructs a lightweight bar from the last row of data, avoiding
+        per-bar pd.Series creation.
+        """
+        if not isinstance(data, pd.DataFrame):
+            # Not a DataFrame (eg. a Series); index positionally
+            return data.iloc[-1]
+
+        # Fetch (or create) the bar class for this column layout
+        key = tuple(data.columns)
+        bar_type = self._bar_type_cache.get(key)
+        if bar_type is None:
+            bar_type = _bar_class(data.columns)
+            self._bar_type_cache[key] = bar_type
+
+        return bar_type(*data.values[-1], data.index[-1])
+
 
 class TradeWatcher:
     """Watches trade snapshots to detect new trades."""